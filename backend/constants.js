@@ -0,0 +1,19 @@
+// Shared domain enums, declared once so the Mongoose schema, the request
+// validators and the slot tables can never drift apart.
+const TIME_SLOTS = [
+  '9:00–10:00 AM',
+  '10:00–11:00 AM',
+  '11:00–12:00 PM',
+  '12:00–1:00 PM',
+  '2:00–3:00 PM',
+  '3:00–4:00 PM'
+];
+
+// Saturdays are mornings only - the first four slots
+const SATURDAY_SLOTS = TIME_SLOTS.slice(0, 4);
+
+const SEXES = ['Male', 'Female', 'Other'];
+
+const STATUSES = ['scheduled', 'confirmed', 'cancelled', 'completed'];
+
+module.exports = { TIME_SLOTS, SATURDAY_SLOTS, SEXES, STATUSES };
@@ -0,0 +1,17 @@
+// Minimal leveled logger. The level check happens once at module load, so
+// calls below LOG_LEVEL resolve to a no-op and disabled logging costs
+// nothing on the request path. Pass values as extra arguments (printf
+// style) rather than building template strings at the call site, so
+// formatting work only happens for messages that are actually emitted.
+const LEVELS = { debug: 10, info: 20, warn: 30, error: 40 };
+
+const threshold = LEVELS[(process.env.LOG_LEVEL || 'info').toLowerCase()] || LEVELS.info;
+
+const noop = () => {};
+
+module.exports = {
+  debug: threshold <= LEVELS.debug ? (...args) => console.debug(...args) : noop,
+  info: threshold <= LEVELS.info ? (...args) => console.log(...args) : noop,
+  warn: threshold <= LEVELS.warn ? (...args) => console.warn(...args) : noop,
+  error: threshold <= LEVELS.error ? (...args) => console.error(...args) : noop
+};
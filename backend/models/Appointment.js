@@ -1,10 +1,14 @@
 const mongoose = require('mongoose');
+const { randomUUID } = require('node:crypto');
+const { TIME_SLOTS, SEXES, STATUSES } = require('../constants');
 
 const appointmentSchema = new mongoose.Schema({
   id: {
     type: String,
-    required: true,
-    unique: true
+    unique: true,
+    // Named built-in factory: no per-document closure, and any write path
+    // that goes through the model still gets an id
+    default: randomUUID
   },
   name: {
     type: String,
@@ -16,7 +20,7 @@ const appointmentSchema = new mongoose.Schema({
   sex: {
     type: String,
     required: true,
-    enum: ['Male', 'Female', 'Other']
+    enum: SEXES
   },
   age: {
     type: Number,
@@ -38,14 +42,7 @@ const appointmentSchema = new mongoose.Schema({
   timeSlot: {
     type: String,
     required: true,
-    enum: [
-      '9:00–10:00 AM',
-      '10:00–11:00 AM',
-      '11:00–12:00 PM',
-      '12:00–1:00 PM',
-      '2:00–3:00 PM',
-      '3:00–4:00 PM'
-    ]
+    enum: TIME_SLOTS
   },
   createdAt: {
     type: Date,
@@ -54,13 +51,14 @@ const appointmentSchema = new mongoose.Schema({
   status: {
     type: String,
     default: 'scheduled',
-    enum: ['scheduled', 'confirmed', 'cancelled', 'completed']
+    enum: STATUSES
   }
 }, {
   timestamps: true
 });
 
-// Index for efficient querying
-appointmentSchema.index({ appointmentDate: 1, timeSlot: 1 });
+// Unique compound index: lets MongoDB enforce one booking per (date, slot)
+// and serves the date-based queries used by the API
+appointmentSchema.index({ appointmentDate: 1, timeSlot: 1 }, { unique: true, name: 'slot_unique' });
 
 module.exports = mongoose.model('Appointment', appointmentSchema);
\ No newline at end of file
@@ -2,19 +2,38 @@ const express = require('express');
 const mongoose = require('mongoose');
 const cors = require('cors');
 const helmet = require('helmet');
+const compression = require('compression');
 const { body, validationResult } = require('express-validator');
-const { v4: uuidv4 } = require('uuid');
+const { randomUUID } = require('node:crypto');
 require('dotenv').config();
 
 const Appointment = require('./models/Appointment');
+const logger = require('./logger');
+const { TIME_SLOTS: ALL_SLOTS, SATURDAY_SLOTS, SEXES } = require('./constants');
 
 const app = express();
 const PORT = process.env.PORT || 8001;
 
+// API responses are dynamic; skip the per-response ETag hash Express
+// computes inside res.json, and drop the X-Powered-By header
+app.disable('etag');
+app.disable('x-powered-by');
+
 // Middleware
 app.use(helmet());
+// Repetitive JSON (appointment listings in particular) compresses 5-10x;
+// small responses are left alone
+app.use(compression({ threshold: 512 }));
+// Enumerated origins: browsers reject credentials with '*', and a concrete
+// list lets the cors middleware answer from its fast path instead of
+// reflecting every Origin header
+const corsOrigins = (process.env.CORS_ORIGINS || 'http://localhost:3000,http://localhost:5173')
+  .split(',')
+  .map(origin => origin.trim())
+  .filter(Boolean);
+
 app.use(cors({
-  origin: '*',
+  origin: corsOrigins,
   credentials: true,
   methods: ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
   allowedHeaders: ['Content-Type', 'Authorization']
@@ -26,45 +45,176 @@ app.use(express.urlencoded({ extended: true }));
 const mongoUrl = process.env.MONGO_URL || 'mongodb://localhost:27017';
 const dbName = process.env.DB_NAME || 'test_database';
 
-mongoose.connect(`${mongoUrl}/${dbName}`)
-  .then(() => {
-    console.log('✅ Connected to MongoDB successfully');
+mongoose.connect(`${mongoUrl}/${dbName}`, {
+  // Keep a few sockets warm so the first requests after startup (or an
+  // idle period) don't pay the TCP + handshake cost
+  minPoolSize: 5,
+  maxPoolSize: 20,
+  serverSelectionTimeoutMS: 2000
+})
+  .then(async () => {
+    // Round-trip a ping so startup fails fast on an unhealthy MongoDB
+    // instead of surfacing it on the first user request
+    await mongoose.connection.db.admin().command({ ping: 1 });
+    logger.info('✅ Connected to MongoDB successfully');
+    // Sync indexes before taking traffic: this also drops the old
+    // auto-named non-unique (appointmentDate, timeSlot) index from
+    // pre-slot_unique databases, which would otherwise make the unique
+    // index build fail with an IndexOptionsConflict on upgrade
+    await Appointment.syncIndexes();
   })
   .catch((error) => {
-    console.error('❌ MongoDB connection error:', error);
+    logger.error('❌ MongoDB connection error:', error);
     process.exit(1);
   });
 
+// Per-weekday slot tables, indexed by Date#getDay() (Sunday = 0). One
+// lookup answers both "is this slot bookable" and "what can be listed",
+// and keeps the clinic-hours rule in a single structure.
+const ALL_SLOTS_SET = new Set(ALL_SLOTS);
+const SATURDAY_SLOTS_SET = new Set(SATURDAY_SLOTS);
+
+const ALLOWED_SLOTS_BY_DAY = [
+  new Set(),          // Sunday - closed
+  ALL_SLOTS_SET,      // Monday
+  ALL_SLOTS_SET,      // Tuesday
+  ALL_SLOTS_SET,      // Wednesday
+  ALL_SLOTS_SET,      // Thursday
+  ALL_SLOTS_SET,      // Friday
+  SATURDAY_SLOTS_SET  // Saturday - mornings only
+];
+
+// One bit per slot (bit i = ALL_SLOTS[i]): clinic hours and bookings both
+// collapse to 6-bit masks, so computing availability is a couple of ALU ops
+const SLOT_BIT = new Map(ALL_SLOTS.map((slot, index) => [slot, 1 << index]));
+const ALL_SLOTS_MASK = (1 << ALL_SLOTS.length) - 1;
+const SATURDAY_MASK = (1 << SATURDAY_SLOTS.length) - 1;
+
+const ALLOWED_MASK_BY_DAY = [
+  0,                // Sunday - closed
+  ALL_SLOTS_MASK,   // Monday
+  ALL_SLOTS_MASK,   // Tuesday
+  ALL_SLOTS_MASK,   // Wednesday
+  ALL_SLOTS_MASK,   // Thursday
+  ALL_SLOTS_MASK,   // Friday
+  SATURDAY_MASK     // Saturday - mornings only
+];
+
+const SLOT_UNAVAILABLE_MESSAGE_BY_DAY = [
+  'Appointments are not available on Sundays',
+  'This time slot is not available for the selected date',
+  'This time slot is not available for the selected date',
+  'This time slot is not available for the selected date',
+  'This time slot is not available for the selected date',
+  'This time slot is not available for the selected date',
+  'On Saturdays, appointments are only available until 1:00 PM'
+];
+
+// Short-TTL cache for available-slots responses, invalidated when a booking
+// lands on the cached date. Slot availability only changes on bookings, so a
+// small in-process cache absorbs the read-heavy slot browsing traffic.
+// Bounded: expired entries are swept and the oldest evicted once the cap
+// is hit, so a client scanning arbitrary dates can't grow the Map forever
+const SLOT_CACHE_TTL_MS = 60 * 1000;
+const SLOT_CACHE_MAX_ENTRIES = 500;
+const slotCache = new Map();
+
+const getCachedSlots = (dateKey) => {
+  const entry = slotCache.get(dateKey);
+  if (!entry) {
+    return null;
+  }
+  if (Date.now() > entry.expiresAt) {
+    slotCache.delete(dateKey);
+    return null;
+  }
+  return entry.payload;
+};
+
+const setCachedSlots = (dateKey, payload) => {
+  if (slotCache.size >= SLOT_CACHE_MAX_ENTRIES && !slotCache.has(dateKey)) {
+    const now = Date.now();
+    for (const [key, entry] of slotCache) {
+      if (now > entry.expiresAt) {
+        slotCache.delete(key);
+      }
+    }
+    // Still full after the sweep: drop the oldest insertions (Map
+    // iteration follows insertion order)
+    while (slotCache.size >= SLOT_CACHE_MAX_ENTRIES) {
+      slotCache.delete(slotCache.keys().next().value);
+    }
+  }
+  slotCache.set(dateKey, { payload, expiresAt: Date.now() + SLOT_CACHE_TTL_MS });
+};
+
+const invalidateSlotCache = (dateKey) => {
+  slotCache.delete(dateKey);
+};
+
+// Strict YYYY-MM-DD parser for query parameters: one precompiled regex plus
+// Date.UTC, instead of the engine's lenient date-string heuristics. Returns
+// a UTC-midnight Date, or null for anything malformed (including rollover
+// dates like 2026-02-31).
+const ISO_DATE_RE = /^(\d{4})-(\d{2})-(\d{2})$/;
+
+const parseIsoDate = (value) => {
+  const match = ISO_DATE_RE.exec(value);
+  if (!match) {
+    return null;
+  }
+  const month = +match[2];
+  const day = +match[3];
+  const date = new Date(Date.UTC(+match[1], month - 1, day));
+  if (date.getUTCMonth() !== month - 1 || date.getUTCDate() !== day) {
+    return null;
+  }
+  return date;
+};
+
+// Appointment dates are stored as BSON Dates normalised to UTC midnight so
+// equality queries and the unique slot index line up regardless of whether
+// the client sent a bare date or a full timestamp
+const toUtcMidnight = (value) => {
+  const date = new Date(value);
+  date.setUTCHours(0, 0, 0, 0);
+  return date;
+};
+
+// Start-of-today timestamp, cached and recomputed only when the clock
+// passes midnight, so the per-request past-date check stays allocation-free
+let todayStartMs = 0;
+let nextMidnightMs = 0;
+
+const startOfToday = () => {
+  const now = Date.now();
+  if (now >= nextMidnightMs) {
+    const today = new Date(now);
+    today.setHours(0, 0, 0, 0);
+    todayStartMs = today.getTime();
+    const nextMidnight = new Date(todayStartMs);
+    nextMidnight.setDate(nextMidnight.getDate() + 1);
+    nextMidnightMs = nextMidnight.getTime();
+  }
+  return todayStartMs;
+};
+
 // Helper function to validate appointment slot
 const validateAppointmentSlot = (appointmentDate, timeSlot) => {
   const date = new Date(appointmentDate);
   const dayOfWeek = date.getDay(); // Sunday is 0, Monday is 1, etc.
-  
-  // Sunday - no appointments allowed
-  if (dayOfWeek === 0) {
+
+  if (!ALLOWED_SLOTS_BY_DAY[dayOfWeek].has(timeSlot)) {
     return {
       isValid: false,
-      message: 'Appointments are not available on Sundays'
+      message: SLOT_UNAVAILABLE_MESSAGE_BY_DAY[dayOfWeek]
     };
   }
-  
-  // Saturday - only until 1:00 PM
-  if (dayOfWeek === 6) {
-    const afternoonSlots = ['2:00–3:00 PM', '3:00–4:00 PM'];
-    if (afternoonSlots.includes(timeSlot)) {
-      return {
-        isValid: false,
-        message: 'On Saturdays, appointments are only available until 1:00 PM'
-      };
-    }
-  }
-  
+
   // Check for past dates
-  const today = new Date();
-  today.setHours(0, 0, 0, 0);
   date.setHours(0, 0, 0, 0);
-  
-  if (date < today) {
+
+  if (date.getTime() < startOfToday()) {
     return {
       isValid: false,
       message: 'Cannot book appointments for past dates'
@@ -74,56 +224,80 @@ const validateAppointmentSlot = (appointmentDate, timeSlot) => {
   return { isValid: true };
 };
 
-// Validation middleware
-const appointmentValidation = [
-  body('name')
+// Single response serialiser shared by the booking and listing endpoints.
+// Building every response through one function keeps the object shape
+// monomorphic for V8 and gives one place to evolve the wire format.
+const toAppointmentResponse = (appointment) => ({
+  id: appointment.id,
+  name: appointment.name,
+  sex: appointment.sex,
+  age: appointment.age,
+  complaint: appointment.complaint,
+  appointmentDate: appointment.appointmentDate,
+  timeSlot: appointment.timeSlot,
+  createdAt: appointment.createdAt,
+  status: appointment.status,
+  appointment_date: appointment.appointmentDate.toISOString().split('T')[0],
+  time_slot: appointment.timeSlot,
+  created_at: appointment.createdAt
+});
+
+// Validation middleware. The field rules are built from a prefix so the
+// same definitions cover the flat create body ('') and every element of a
+// bulk array body ('*.').
+const appointmentRules = (prefix) => [
+  body(`${prefix}name`)
     .trim()
     .notEmpty()
     .withMessage('Name is required')
     .isLength({ min: 2, max: 100 })
     .withMessage('Name must be between 2 and 100 characters'),
-  
-  body('sex')
+
+  body(`${prefix}sex`)
     .notEmpty()
     .withMessage('Sex is required')
-    .isIn(['Male', 'Female', 'Other'])
+    .isIn(SEXES)
     .withMessage('Sex must be Male, Female, or Other'),
-  
-  body('age')
+
+  body(`${prefix}age`)
     .isInt({ min: 0, max: 150 })
     .withMessage('Age must be a number between 0 and 150'),
-  
-  body('complaint')
+
+  body(`${prefix}complaint`)
     .trim()
     .notEmpty()
     .withMessage('Complaint is required')
     .isLength({ min: 5, max: 500 })
     .withMessage('Complaint must be between 5 and 500 characters'),
-  
-  body('appointmentDate')
+
+  body(`${prefix}appointmentDate`)
     .isISO8601()
     .toDate()
     .withMessage('Valid appointment date is required'),
-  
-  body('timeSlot')
+
+  body(`${prefix}timeSlot`)
     .notEmpty()
     .withMessage('Time slot is required')
-    .isIn([
-      '9:00–10:00 AM',
-      '10:00–11:00 AM',
-      '11:00–12:00 PM',
-      '12:00–1:00 PM',
-      '2:00–3:00 PM',
-      '3:00–4:00 PM'
-    ])
+    .isIn(ALL_SLOTS)
     .withMessage('Invalid time slot selected')
 ];
 
+const appointmentValidation = appointmentRules('');
+
+const bulkAppointmentValidation = [
+  body()
+    .isArray({ min: 1, max: 20 })
+    .withMessage('Request body must be an array of 1 to 20 appointments'),
+  ...appointmentRules('*.')
+];
+
 // Routes
 
-// Health check
+// Health check - static payload, serialised once at module load
+const HEALTH_BODY = Buffer.from(JSON.stringify({ message: 'Dental Clinic Appointment System API' }));
+
 app.get('/api/', (req, res) => {
-  res.json({ message: 'Dental Clinic Appointment System API' });
+  res.type('application/json').send(HEALTH_BODY);
 });
 
 // Create appointment
@@ -148,69 +322,158 @@ app.post('/api/appointments', appointmentValidation, async (req, res) => {
       });
     }
 
-    // Check if slot is already booked
-    const existingAppointment = await Appointment.findOne({
-      appointmentDate: new Date(appointmentDate),
-      timeSlot: timeSlot
-    });
+    // The request is fully validated at this point, so the whole write is a
+    // single driver call: build the plain document and insert it directly.
+    // The unique (appointmentDate, timeSlot) index rejects double bookings
+    // atomically, so no pre-check query is needed.
+    const now = new Date();
+    const appointment = {
+      id: randomUUID(),
+      name,
+      sex,
+      age,
+      complaint,
+      appointmentDate: toUtcMidnight(appointmentDate),
+      timeSlot,
+      status: 'scheduled',
+      createdAt: now,
+      updatedAt: now
+    };
+
+    await Appointment.collection.insertOne(appointment);
 
-    if (existingAppointment) {
+    // Availability changed for this date; drop the cached slot list
+    invalidateSlotCache(appointment.appointmentDate.toISOString().split('T')[0]);
+
+    res.status(200).json(toAppointmentResponse(appointment));
+
+  } catch (error) {
+    // Duplicate key on the unique slot index means the slot was taken,
+    // possibly by a concurrent request
+    if (error.code === 11000) {
       return res.status(400).json({
         detail: 'This time slot is already booked for the selected date'
       });
     }
-
-    // Create new appointment
-    const appointment = new Appointment({
-      id: uuidv4(),
-      name,
-      sex,
-      age,
-      complaint,
-      appointmentDate: new Date(appointmentDate),
-      timeSlot
+    logger.error('Error creating appointment:', error);
+    res.status(500).json({
+      detail: `Failed to create appointment: ${error.message}`
     });
+  }
+});
+
+// Bulk-create appointments: one round trip and one unordered insertMany
+// for a whole batch, with per-item results so a taken or restricted slot
+// rejects that booking without sinking the rest of the batch
+app.post('/api/appointments/bulk', bulkAppointmentValidation, async (req, res) => {
+  try {
+    const errors = validationResult(req);
+    if (!errors.isEmpty()) {
+      return res.status(400).json({
+        detail: 'Validation failed',
+        errors: errors.array()
+      });
+    }
 
-    await appointment.save();
+    const now = new Date();
+    const results = new Array(req.body.length);
+    const docs = [];
+    // Position of each doc's item in the request array, for mapping write
+    // errors back to the booking that caused them
+    const docIndexes = [];
+
+    req.body.forEach((item, index) => {
+      const slotValidation = validateAppointmentSlot(item.appointmentDate, item.timeSlot);
+      if (!slotValidation.isValid) {
+        results[index] = { status: 'rejected', detail: slotValidation.message };
+        return;
+      }
+      docs.push({
+        id: randomUUID(),
+        name: item.name,
+        sex: item.sex,
+        age: item.age,
+        complaint: item.complaint,
+        appointmentDate: toUtcMidnight(item.appointmentDate),
+        timeSlot: item.timeSlot,
+        status: 'scheduled',
+        createdAt: now,
+        updatedAt: now
+      });
+      docIndexes.push(index);
+    });
 
-    // Return appointment with date as ISO string for consistency
-    const appointmentResponse = appointment.toObject();
-    appointmentResponse.appointment_date = appointmentResponse.appointmentDate.toISOString().split('T')[0];
-    appointmentResponse.time_slot = appointmentResponse.timeSlot;
-    appointmentResponse.created_at = appointmentResponse.createdAt;
+    if (docs.length > 0) {
+      try {
+        // ordered: false keeps inserting past duplicate-key failures, so
+        // every free slot in the batch is still booked
+        await Appointment.collection.insertMany(docs, { ordered: false });
+      } catch (error) {
+        if (!Array.isArray(error.writeErrors)) {
+          throw error;
+        }
+        for (const writeError of error.writeErrors) {
+          results[docIndexes[writeError.index]] = {
+            status: 'rejected',
+            detail: writeError.code === 11000
+              ? 'This time slot is already booked for the selected date'
+              : 'Failed to create appointment'
+          };
+        }
+      }
+
+      docs.forEach((doc, docIndex) => {
+        const index = docIndexes[docIndex];
+        if (!results[index]) {
+          results[index] = { status: 'created', appointment: toAppointmentResponse(doc) };
+          invalidateSlotCache(doc.appointmentDate.toISOString().split('T')[0]);
+        }
+      });
+    }
 
-    res.status(200).json(appointmentResponse);
+    res.status(200).json({ results });
 
   } catch (error) {
-    console.error('Error creating appointment:', error);
+    logger.error('Error creating appointments in bulk:', error);
     res.status(500).json({
-      detail: `Failed to create appointment: ${error.message}`
+      detail: `Failed to create appointments: ${error.message}`
     });
   }
 });
 
-// Get all appointments
+// Get appointments, paginated via ?limit= / ?skip= with an optional
+// ?from_date= lower bound (an indexed range scan on appointmentDate)
 app.get('/api/appointments', async (req, res) => {
   try {
-    const appointments = await Appointment.find()
+    const limit = Math.min(Math.max(parseInt(req.query.limit, 10) || 50, 1), 200);
+    const skip = Math.max(parseInt(req.query.skip, 10) || 0, 0);
+
+    const filter = {};
+    if (req.query.from_date) {
+      const fromDate = parseIsoDate(req.query.from_date);
+      if (!fromDate) {
+        return res.status(400).json({
+          detail: 'Invalid from_date; use YYYY-MM-DD'
+        });
+      }
+      filter.appointmentDate = { $gte: fromDate };
+    }
+
+    // lean() returns plain objects, skipping Mongoose document hydration
+    // for every row on this read-only path
+    // Project only the fields the client renders; _id and __v never leave
+    // the database
+    const appointments = await Appointment.find(filter)
+      .select('id name sex age complaint appointmentDate timeSlot createdAt status -_id')
       .sort({ appointmentDate: 1 })
-      .limit(1000);
-
-    // Transform response to match frontend expectations
-    const transformedAppointments = appointments.map(appointment => {
-      const appointmentObj = appointment.toObject();
-      return {
-        ...appointmentObj,
-        appointment_date: appointmentObj.appointmentDate.toISOString().split('T')[0],
-        time_slot: appointmentObj.timeSlot,
-        created_at: appointmentObj.createdAt
-      };
-    });
+      .skip(skip)
+      .limit(limit)
+      .lean();
 
-    res.json(transformedAppointments);
+    res.json(appointments.map(toAppointmentResponse));
 
   } catch (error) {
-    console.error('Error fetching appointments:', error);
+    logger.error('Error fetching appointments:', error);
     res.status(500).json({
       detail: `Failed to fetch appointments: ${error.message}`
     });
@@ -228,52 +491,54 @@ app.get('/api/appointments/available-slots', async (req, res) => {
       });
     }
 
-    const targetDate = new Date(appointment_date);
-    const dayOfWeek = targetDate.getDay(); // Sunday is 0
+    const targetDate = parseIsoDate(appointment_date);
+    if (!targetDate) {
+      return res.status(400).json({
+        detail: 'Invalid appointment_date; use YYYY-MM-DD'
+      });
+    }
 
-    // All available slots
-    const allSlots = [
-      '9:00–10:00 AM',
-      '10:00–11:00 AM',
-      '11:00–12:00 PM',
-      '12:00–1:00 PM',
-      '2:00–3:00 PM',
-      '3:00–4:00 PM'
-    ];
+    const dateKey = targetDate.toISOString().split('T')[0];
+    const cached = getCachedSlots(dateKey);
+    if (cached) {
+      return res.json(cached);
+    }
+
+    const dayOfWeek = targetDate.getDay(); // Sunday is 0
 
     // Sunday - no slots
     if (dayOfWeek === 0) {
-      return res.json({
+      const payload = {
         available_slots: [],
         message: 'No appointments available on Sundays'
-      });
-    }
-
-    // Saturday - only morning slots
-    let availableSlots = allSlots;
-    if (dayOfWeek === 6) {
-      availableSlots = [
-        '9:00–10:00 AM',
-        '10:00–11:00 AM',
-        '11:00–12:00 PM',
-        '12:00–1:00 PM'
-      ];
+      };
+      setCachedSlots(dateKey, payload);
+      return res.json(payload);
     }
 
-    // Get booked slots for the date
-    const bookedAppointments = await Appointment.find({
+    // Let MongoDB return just the booked slot strings instead of full documents
+    const bookedSlots = await Appointment.distinct('timeSlot', {
       appointmentDate: targetDate
     });
 
-    const bookedSlots = bookedAppointments.map(appointment => appointment.timeSlot);
-    const finalAvailableSlots = availableSlots.filter(slot => !bookedSlots.includes(slot));
+    // availability = allowed-for-this-weekday AND NOT booked, as bitmasks
+    let bookedMask = 0;
+    for (const slot of bookedSlots) {
+      bookedMask |= SLOT_BIT.get(slot) || 0;
+    }
+    const availableMask = ALLOWED_MASK_BY_DAY[dayOfWeek] & ~bookedMask;
+
+    const finalAvailableSlots = ALL_SLOTS.filter((slot, index) => availableMask & (1 << index));
 
-    res.json({
+    const payload = {
       available_slots: finalAvailableSlots
-    });
+    };
+    setCachedSlots(dateKey, payload);
+
+    res.json(payload);
 
   } catch (error) {
-    console.error('Error fetching available slots:', error);
+    logger.error('Error fetching available slots:', error);
     res.status(500).json({
       detail: `Failed to fetch available slots: ${error.message}`
     });
@@ -282,7 +547,7 @@ app.get('/api/appointments/available-slots', async (req, res) => {
 
 // Error handling middleware
 app.use((error, req, res, next) => {
-  console.error('Unhandled error:', error);
+  logger.error('Unhandled error:', error);
   res.status(500).json({
     detail: 'Internal server error'
   });
@@ -296,24 +561,29 @@ app.use((req, res) => {
 });
 
 // Start server
-app.listen(PORT, '0.0.0.0', () => {
-  console.log(`🚀 Server running on http://0.0.0.0:${PORT}`);
-  console.log(`📋 API endpoints available at http://0.0.0.0:${PORT}/api/`);
+const server = app.listen(PORT, '0.0.0.0', () => {
+  logger.info(`🚀 Server running on http://0.0.0.0:${PORT}`);
+  logger.info(`📋 API endpoints available at http://0.0.0.0:${PORT}/api/`);
 });
 
+// Keep client connections alive slightly longer than typical proxy idle
+// timeouts so pooled clients reuse sockets instead of reconnecting
+server.keepAliveTimeout = 65000;
+server.headersTimeout = 66000;
+
 // Graceful shutdown
 process.on('SIGTERM', () => {
-  console.log('SIGTERM received, shutting down gracefully');
+  logger.info('SIGTERM received, shutting down gracefully');
   mongoose.connection.close(() => {
-    console.log('MongoDB connection closed');
+    logger.info('MongoDB connection closed');
     process.exit(0);
   });
 });
 
 process.on('SIGINT', () => {
-  console.log('SIGINT received, shutting down gracefully');
+  logger.info('SIGINT received, shutting down gracefully');
   mongoose.connection.close(() => {
-    console.log('MongoDB connection closed');
+    logger.info('MongoDB connection closed');
     process.exit(0);
   });
 });
\ No newline at end of file
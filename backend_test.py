@@ -1,499 +1,361 @@
 #!/usr/bin/env python3
 """
-Backend API Testing Script for Dental Appointment System
-Tests Node.js + Express backend with MongoDB integration
+Backend API integration tests for the Dental Appointment System
+(Node.js + Express backend with MongoDB).
+
+Run directly (python backend_test.py) or through pytest; with pytest-xdist
+installed the tests parallelise across workers (pytest -n auto). Each test
+owns its data - distinct dates/slots per test - so no ordering is required.
+The whole module skips if the backend is not reachable.
 """
 
-import requests
+import functools
 import json
+import logging
+import socket
 import sys
-from datetime import datetime, timedelta
+import threading
 import uuid
+from datetime import date
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 import urllib3
 
 # Disable SSL warnings for testing
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Diagnostics go through logging, not print: pytest buffers log records per
+# test and only renders them on failure, so a green run writes nothing to
+# stdout. Lazy %-formatting keeps dropped records free.
+log = logging.getLogger(__name__)
+
 # Backend URL - using localhost for testing since external URL has routing issues
 BACKEND_URL = "http://localhost:8001/api"
 
-class BackendTester:
-    def __init__(self):
-        self.session = requests.Session()
-        # No need for SSL verification when using localhost
-        self.test_results = []
-        self.appointments_created = []
-        
-    def log_test(self, test_name, success, details=""):
-        """Log test results"""
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status}: {test_name}")
-        if details:
-            print(f"   Details: {details}")
-        self.test_results.append({
-            "test": test_name,
-            "success": success,
-            "details": details
-        })
-        
-    def test_mongodb_connection(self):
-        """Test 1: MongoDB connection via health check"""
-        try:
-            response = self.session.get(f"{BACKEND_URL}/")
-            if response.status_code == 200:
-                data = response.json()
-                if "message" in data and "Dental Clinic" in data["message"]:
-                    self.log_test("MongoDB Connection (Health Check)", True, 
-                                f"Server responding: {data['message']}")
-                    return True
-                else:
-                    self.log_test("MongoDB Connection (Health Check)", False, 
-                                f"Unexpected response: {data}")
-                    return False
-            else:
-                self.log_test("MongoDB Connection (Health Check)", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                return False
-        except Exception as e:
-            self.log_test("MongoDB Connection (Health Check)", False, f"Connection error: {str(e)}")
-            return False
-    
-    def test_post_appointments_endpoint(self):
-        """Test 2: POST /api/appointments endpoint"""
-        # Test valid appointment creation
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-        
-        # Test data with realistic information
-        test_appointment = {
-            "name": "Dr. Sarah Johnson",
-            "sex": "Female", 
-            "age": 35,
-            "complaint": "Routine dental checkup and cleaning needed",
-            "appointmentDate": tomorrow,
-            "timeSlot": "10:00–11:00 AM"
-        }
-        
-        try:
-            response = self.session.post(f"{BACKEND_URL}/appointments", 
-                                       json=test_appointment,
-                                       headers={'Content-Type': 'application/json'})
-            
-            if response.status_code == 200:
-                data = response.json()
-                if "id" in data and data["name"] == test_appointment["name"]:
-                    self.appointments_created.append(data["id"])
-                    self.log_test("POST /api/appointments (Valid Data)", True, 
-                                f"Created appointment ID: {data['id']}")
-                    
-                    # Test duplicate booking prevention
-                    duplicate_response = self.session.post(f"{BACKEND_URL}/appointments", 
-                                                         json=test_appointment,
-                                                         headers={'Content-Type': 'application/json'})
-                    
-                    if duplicate_response.status_code == 400:
-                        self.log_test("POST /api/appointments (Duplicate Prevention)", True, 
-                                    "Correctly rejected duplicate booking")
-                    else:
-                        self.log_test("POST /api/appointments (Duplicate Prevention)", False, 
-                                    f"Should reject duplicate: {duplicate_response.status_code}")
-                    
-                    return True
-                else:
-                    self.log_test("POST /api/appointments (Valid Data)", False, 
-                                f"Invalid response structure: {data}")
-                    return False
-            else:
-                self.log_test("POST /api/appointments (Valid Data)", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                return False
-                
-        except Exception as e:
-            self.log_test("POST /api/appointments (Valid Data)", False, f"Request error: {str(e)}")
-            return False
-    
-    def test_post_appointments_validation(self):
-        """Test 3: POST /api/appointments validation"""
-        # Test invalid data scenarios
-        test_cases = [
-            {
-                "name": "Invalid Age Test",
-                "data": {
-                    "name": "Test User",
-                    "sex": "Male",
-                    "age": -5,  # Invalid negative age
-                    "complaint": "Test complaint for validation",
-                    "appointmentDate": (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d'),
-                    "timeSlot": "9:00–10:00 AM"
-                },
-                "expected_status": 400
-            },
-            {
-                "name": "Invalid Name Test", 
-                "data": {
-                    "name": "A",  # Too short
-                    "sex": "Female",
-                    "age": 25,
-                    "complaint": "Test complaint for validation",
-                    "appointmentDate": (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d'),
-                    "timeSlot": "11:00–12:00 PM"
-                },
-                "expected_status": 400
-            },
-            {
-                "name": "Invalid Complaint Test",
-                "data": {
-                    "name": "Test User",
-                    "sex": "Other",
-                    "age": 30,
-                    "complaint": "Hi",  # Too short
-                    "appointmentDate": (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d'),
-                    "timeSlot": "12:00–1:00 PM"
-                },
-                "expected_status": 400
-            }
-        ]
-        
-        all_passed = True
-        for test_case in test_cases:
-            try:
-                response = self.session.post(f"{BACKEND_URL}/appointments", 
-                                           json=test_case["data"],
-                                           headers={'Content-Type': 'application/json'})
-                
-                if response.status_code == test_case["expected_status"]:
-                    self.log_test(f"POST Validation - {test_case['name']}", True, 
-                                f"Correctly rejected with status {response.status_code}")
-                else:
-                    self.log_test(f"POST Validation - {test_case['name']}", False, 
-                                f"Expected {test_case['expected_status']}, got {response.status_code}")
-                    all_passed = False
-                    
-            except Exception as e:
-                self.log_test(f"POST Validation - {test_case['name']}", False, f"Request error: {str(e)}")
-                all_passed = False
-                
-        return all_passed
-    
-    def test_get_appointments_endpoint(self):
-        """Test 4: GET /api/appointments endpoint"""
-        try:
-            response = self.session.get(f"{BACKEND_URL}/appointments")
-            
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, list):
-                    # Check if our created appointment is in the list
-                    found_appointment = False
-                    for appointment in data:
-                        if appointment.get("id") in self.appointments_created:
-                            found_appointment = True
-                            break
-                    
-                    if found_appointment or len(data) >= 0:  # Allow empty list
-                        self.log_test("GET /api/appointments", True, 
-                                    f"Retrieved {len(data)} appointments successfully")
-                        
-                        # Verify data structure
-                        if len(data) > 0:
-                            sample = data[0]
-                            required_fields = ["id", "name", "sex", "age", "complaint", "appointment_date", "time_slot"]
-                            missing_fields = [field for field in required_fields if field not in sample]
-                            
-                            if not missing_fields:
-                                self.log_test("GET /api/appointments (Data Structure)", True, 
-                                            "All required fields present in response")
-                            else:
-                                self.log_test("GET /api/appointments (Data Structure)", False, 
-                                            f"Missing fields: {missing_fields}")
-                        
-                        return True
-                    else:
-                        self.log_test("GET /api/appointments", False, 
-                                    "Created appointment not found in response")
-                        return False
-                else:
-                    self.log_test("GET /api/appointments", False, 
-                                f"Expected array, got: {type(data)}")
-                    return False
-            else:
-                self.log_test("GET /api/appointments", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                return False
-                
-        except Exception as e:
-            self.log_test("GET /api/appointments", False, f"Request error: {str(e)}")
-            return False
-    
-    def test_get_available_slots_endpoint(self):
-        """Test 5: GET /api/appointments/available-slots endpoint"""
-        # Test weekday slots
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-        
-        try:
-            response = self.session.get(f"{BACKEND_URL}/appointments/available-slots", 
-                                      params={"appointment_date": tomorrow})
-            
-            if response.status_code == 200:
-                data = response.json()
-                if "available_slots" in data:
-                    slots = data["available_slots"]
-                    self.log_test("GET /api/appointments/available-slots (Weekday)", True, 
-                                f"Retrieved {len(slots)} available slots")
-                    
-                    # Test Saturday restrictions
-                    # Find next Saturday
-                    current_date = datetime.now()
-                    days_until_saturday = (5 - current_date.weekday()) % 7
-                    if days_until_saturday == 0:  # Today is Saturday
-                        days_until_saturday = 7
-                    saturday = (current_date + timedelta(days=days_until_saturday)).strftime('%Y-%m-%d')
-                    
-                    saturday_response = self.session.get(f"{BACKEND_URL}/appointments/available-slots", 
-                                                       params={"appointment_date": saturday})
-                    
-                    if saturday_response.status_code == 200:
-                        saturday_data = saturday_response.json()
-                        saturday_slots = saturday_data.get("available_slots", [])
-                        
-                        # Saturday should only have morning slots
-                        afternoon_slots = ["2:00–3:00 PM", "3:00–4:00 PM"]
-                        has_afternoon = any(slot in afternoon_slots for slot in saturday_slots)
-                        
-                        if not has_afternoon:
-                            self.log_test("GET /api/appointments/available-slots (Saturday Restriction)", True, 
-                                        f"Saturday correctly shows only morning slots: {len(saturday_slots)} slots")
-                        else:
-                            self.log_test("GET /api/appointments/available-slots (Saturday Restriction)", False, 
-                                        f"Saturday incorrectly shows afternoon slots: {saturday_slots}")
-                    
-                    # Test Sunday restrictions
-                    # Find next Sunday
-                    days_until_sunday = (6 - current_date.weekday()) % 7
-                    if days_until_sunday == 0:  # Today is Sunday
-                        days_until_sunday = 7
-                    sunday = (current_date + timedelta(days=days_until_sunday)).strftime('%Y-%m-%d')
-                    
-                    sunday_response = self.session.get(f"{BACKEND_URL}/appointments/available-slots", 
-                                                     params={"appointment_date": sunday})
-                    
-                    if sunday_response.status_code == 200:
-                        sunday_data = sunday_response.json()
-                        sunday_slots = sunday_data.get("available_slots", [])
-                        
-                        if len(sunday_slots) == 0:
-                            self.log_test("GET /api/appointments/available-slots (Sunday Restriction)", True, 
-                                        "Sunday correctly shows no available slots")
-                        else:
-                            self.log_test("GET /api/appointments/available-slots (Sunday Restriction)", False, 
-                                        f"Sunday incorrectly shows slots: {sunday_slots}")
-                    
-                    return True
-                else:
-                    self.log_test("GET /api/appointments/available-slots", False, 
-                                f"Missing 'available_slots' in response: {data}")
-                    return False
-            else:
-                self.log_test("GET /api/appointments/available-slots", False, 
-                            f"HTTP {response.status_code}: {response.text}")
-                return False
-                
-        except Exception as e:
-            self.log_test("GET /api/appointments/available-slots", False, f"Request error: {str(e)}")
-            return False
-    
-    def test_saturday_sunday_restrictions(self):
-        """Test 6: Saturday/Sunday booking restrictions"""
-        # Find next Saturday and Sunday
-        current_date = datetime.now()
-        
-        # Saturday test
-        days_until_saturday = (5 - current_date.weekday()) % 7
-        if days_until_saturday == 0:
-            days_until_saturday = 7
-        saturday = (current_date + timedelta(days=days_until_saturday)).strftime('%Y-%m-%d')
-        
-        # Try to book afternoon slot on Saturday
-        saturday_afternoon_appointment = {
-            "name": "Saturday Test User",
-            "sex": "Male",
-            "age": 40,
-            "complaint": "Testing Saturday afternoon restriction",
-            "appointmentDate": saturday,
-            "timeSlot": "2:00–3:00 PM"  # Should be rejected
-        }
-        
-        try:
-            response = self.session.post(f"{BACKEND_URL}/appointments", 
-                                       json=saturday_afternoon_appointment,
-                                       headers={'Content-Type': 'application/json'})
-            
-            if response.status_code == 400:
-                self.log_test("Saturday Afternoon Restriction", True, 
-                            "Correctly rejected Saturday afternoon booking")
-            else:
-                self.log_test("Saturday Afternoon Restriction", False, 
-                            f"Should reject Saturday afternoon: {response.status_code}")
-        
-        except Exception as e:
-            self.log_test("Saturday Afternoon Restriction", False, f"Request error: {str(e)}")
-        
-        # Sunday test
-        days_until_sunday = (6 - current_date.weekday()) % 7
-        if days_until_sunday == 0:
-            days_until_sunday = 7
-        sunday = (current_date + timedelta(days=days_until_sunday)).strftime('%Y-%m-%d')
-        
-        # Try to book any slot on Sunday
-        sunday_appointment = {
-            "name": "Sunday Test User",
-            "sex": "Female",
-            "age": 30,
-            "complaint": "Testing Sunday booking restriction",
-            "appointmentDate": sunday,
-            "timeSlot": "10:00–11:00 AM"  # Should be rejected
-        }
-        
+# Test dates, computed once at import as plain integer ordinals - pure int
+# arithmetic instead of date/timedelta allocations per step, converted to
+# ISO strings exactly once at the end. (Every test used to rebuild these
+# from datetime.now(), which was redundant work and could straddle midnight
+# mid-run.)
+_TODAY_ORD = date.today().toordinal()
+# Ordinal 1 (0001-01-01) was a Monday, so weekday() == (ordinal - 1) % 7
+_TODAY_DOW = (_TODAY_ORD - 1) % 7
+
+def _iso(ordinal):
+    return date.fromordinal(ordinal).isoformat()
+
+def _next_dow_ord(target_weekday):
+    """Ordinal of the next occurrence of the weekday (Mon=0), always future."""
+    return _TODAY_ORD + ((target_weekday - _TODAY_DOW) % 7 or 7)
+
+# Days to add to reach the next weekday, indexed by weekday (Mon=0):
+# Fri -> Mon is +3, Sat -> Mon +2, Sun -> Mon +1, otherwise just tomorrow.
+# O(1) arithmetic instead of a skip-the-weekend loop, and it keeps the
+# "valid booking" tests off Saturdays/Sundays where slots are restricted.
+_SKIP_TO_WEEKDAY = (1, 1, 1, 1, 3, 2, 1)
+
+def _next_weekday_ord(ordinal):
+    return ordinal + _SKIP_TO_WEEKDAY[(ordinal - 1) % 7]
+
+_NEXT_WEEKDAY_ORD = _next_weekday_ord(_TODAY_ORD)
+NEXT_WEEKDAY = _iso(_NEXT_WEEKDAY_ORD)
+SECOND_WEEKDAY = _iso(_next_weekday_ord(_NEXT_WEEKDAY_ORD))
+NEXT_SATURDAY = _iso(_next_dow_ord(5))
+NEXT_SUNDAY = _iso(_next_dow_ord(6))
+
+# Base booking payload built once; each test overrides only the fields it
+# actually exercises instead of spelling out the whole dict
+BASE_APPOINTMENT = {
+    "name": "Test User",
+    "sex": "Male",
+    "age": 30,
+    "complaint": "Test complaint for validation",
+    "appointmentDate": NEXT_WEEKDAY,
+    "timeSlot": "9:00–10:00 AM"
+}
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter with TCP keepalive on every pooled socket.
+
+    HTTP/1.1 keep-alive already reuses connections between requests; this
+    additionally stops idle pool sockets from being dropped by the OS or
+    intermediaries mid-run, so every test after the first skips the TCP
+    handshake instead of silently reconnecting.
+    """
+
+    _SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Set when the backend connection is lost mid-run. Every later request
+# skips immediately instead of burning a connect timeout per test.
+_ABORT = threading.Event()
+
+# (connect, read) applied to every request unless a caller overrides it, so
+# a hung backend bounds each test instead of stalling the whole suite
+DEFAULT_TIMEOUT = (3.05, 10)
+
+
+class _FailFastSession(requests.Session):
+    """Session that stops issuing requests once the backend has gone away.
+
+    Also fills in DEFAULT_TIMEOUT, since requests itself defaults to
+    waiting forever.
+    """
+
+    def request(self, *args, **kwargs):
+        if _ABORT.is_set():
+            pytest.skip("backend connection lost earlier in the run")
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
         try:
-            response = self.session.post(f"{BACKEND_URL}/appointments", 
-                                       json=sunday_appointment,
-                                       headers={'Content-Type': 'application/json'})
-            
-            if response.status_code == 400:
-                self.log_test("Sunday Booking Restriction", True, 
-                            "Correctly rejected Sunday booking")
-                return True
-            else:
-                self.log_test("Sunday Booking Restriction", False, 
-                            f"Should reject Sunday booking: {response.status_code}")
-                return False
-        
-        except Exception as e:
-            self.log_test("Sunday Booking Restriction", False, f"Request error: {str(e)}")
-            return False
-    
-    def test_data_persistence(self):
-        """Test 7: Verify data persistence in MongoDB"""
-        # Create a unique appointment and verify it persists
-        tomorrow = (datetime.now() + timedelta(days=2)).strftime('%Y-%m-%d')
-        unique_name = f"Persistence Test User {uuid.uuid4().hex[:8]}"
-        
-        test_appointment = {
-            "name": unique_name,
-            "sex": "Other",
-            "age": 28,
-            "complaint": "Testing data persistence in MongoDB database",
-            "appointmentDate": tomorrow,
-            "timeSlot": "9:00–10:00 AM"
+            return super().request(*args, **kwargs)
+        except requests.ConnectionError:
+            _ABORT.set()
+            raise
+
+
+# Pooled session shared by all tests: keep-alive connections instead of TCP
+# setup per request, with a couple of quick retries for transient hiccups
+SESSION = _FailFastSession()
+# Pool sized for 8+ parallel xdist workers so nobody blocks on a slot;
+# retries also cover transient gateway errors, not just connection drops
+_adapter = _KeepAliveAdapter(
+    pool_connections=8,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+# Set once on the session so per-call header dicts are unnecessary. The
+# explicit charset makes the pre-encoded bytes below self-describing.
+SESSION.headers.update({"Content-Type": "application/json; charset=utf-8"})
+
+
+def _encode_body(payload):
+    """Serialise a payload to compact UTF-8 bytes once, up front.
+
+    Posting bytes via data= skips the per-call json.dumps and charset
+    handling inside PreparedRequest; static payloads encode once at import.
+    """
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _post_appointment(body):
+    """POST pre-encoded booking bytes and return the response."""
+    return SESSION.post(f"{BACKEND_URL}/appointments", data=body)
+
+
+def _post_status(body):
+    """POST pre-encoded booking bytes and return only the status code.
+
+    Rejection tests never look at the body, so stream the response and
+    close it immediately - the error JSON is never buffered or parsed.
+    """
+    response = SESSION.post(f"{BACKEND_URL}/appointments", data=body, stream=True)
+    try:
+        return response.status_code
+    finally:
+        response.close()
+
+
+@functools.lru_cache(maxsize=64)
+def _get_json(path, params=()):
+    """Memoised GET, keyed by path and params.
+
+    Several tests read the same listing/slot endpoints; within a run those
+    responses only change when a booking succeeds, so repeated reads come
+    from the cache. Call _get_json.cache_clear() after a successful POST.
+    """
+    response = SESSION.get(f"{BACKEND_URL}{path}", params=dict(params))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def backend():
+    """Skip the whole module when the backend is not reachable."""
+    try:
+        response = SESSION.get(f"{BACKEND_URL}/", timeout=5)
+    except requests.RequestException as e:
+        pytest.skip(f"backend not reachable at {BACKEND_URL}: {e}")
+    if response.status_code != 200:
+        pytest.skip(f"backend unhealthy at {BACKEND_URL}: HTTP {response.status_code}")
+
+
+def test_health_check():
+    """Health check reports the API is up (and therefore MongoDB connected)."""
+    response = SESSION.get(f"{BACKEND_URL}/")
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert "Dental Clinic" in data.get("message", ""), data
+
+
+def test_create_appointment_and_duplicate_prevention():
+    """A valid booking succeeds; rebooking the same slot is rejected."""
+    test_appointment = {
+        **BASE_APPOINTMENT,
+        "name": "Dr. Sarah Johnson",
+        "sex": "Female",
+        "age": 35,
+        "complaint": "Routine dental checkup and cleaning needed",
+        "timeSlot": "10:00–11:00 AM"
+    }
+    body = _encode_body(test_appointment)
+
+    response = _post_appointment(body)
+    assert response.status_code == 200, response.text
+    _get_json.cache_clear()  # listing/slot responses are stale now
+    data = response.json()
+    assert "id" in data, data
+    assert data["name"] == test_appointment["name"], data
+    log.info("created appointment %s on %s", data["id"], test_appointment["appointmentDate"])
+
+    # The same (date, slot) must be rejected; only the status matters,
+    # and the bytes are already encoded from the first POST
+    assert _post_status(body) == 400
+
+
+# Every rejection scenario is the same shape - override a few fields,
+# expect a 400 - so they live in one data table instead of six
+# near-identical test bodies
+REJECTION_CASES = [
+    ("invalid-age", {"age": -5, "timeSlot": "9:00–10:00 AM"}),
+    ("invalid-name", {"name": "A", "timeSlot": "11:00–12:00 PM"}),
+    ("invalid-complaint", {"complaint": "Hi", "timeSlot": "12:00–1:00 PM"}),
+    ("saturday-afternoon", {
+        "name": "Saturday Test User",
+        "age": 40,
+        "complaint": "Testing Saturday afternoon restriction",
+        "appointmentDate": NEXT_SATURDAY,
+        "timeSlot": "2:00–3:00 PM"
+    }),
+    ("sunday-closed", {
+        "name": "Sunday Test User",
+        "sex": "Female",
+        "complaint": "Testing Sunday booking restriction",
+        "appointmentDate": NEXT_SUNDAY,
+        "timeSlot": "10:00–11:00 AM"
+    }),
+]
+
+# The rejection payloads never change within a run, so encode each one to
+# bytes exactly once at import
+_REJECTION_BODIES = [
+    (label, _encode_body({**BASE_APPOINTMENT, **overrides}))
+    for label, overrides in REJECTION_CASES
+]
+
+
+@pytest.mark.parametrize("body", [body for _, body in _REJECTION_BODIES],
+                         ids=[label for label, _ in _REJECTION_BODIES])
+def test_booking_rejected(body):
+    """Invalid or restricted bookings are rejected with 400."""
+    assert _post_status(body) == 400
+
+
+def test_get_all_appointments():
+    """The listing endpoint returns well-formed appointment records."""
+    data = _get_json("/appointments")
+    assert isinstance(data, list), type(data)
+
+    required_fields = ["id", "name", "sex", "age", "complaint", "appointment_date", "time_slot"]
+    for appointment in data:
+        missing = [field for field in required_fields if field not in appointment]
+        assert not missing, f"missing fields {missing} in {appointment}"
+
+
+def test_available_slots_weekday():
+    data = _get_json("/appointments/available-slots",
+                     (("appointment_date", NEXT_WEEKDAY),))
+    assert "available_slots" in data
+
+
+def test_available_slots_saturday_morning_only():
+    data = _get_json("/appointments/available-slots",
+                     (("appointment_date", NEXT_SATURDAY),))
+    slots = data.get("available_slots", [])
+    afternoon_slots = {"2:00–3:00 PM", "3:00–4:00 PM"}
+    assert not afternoon_slots.intersection(slots), slots
+
+
+def test_available_slots_sunday_closed():
+    data = _get_json("/appointments/available-slots",
+                     (("appointment_date", NEXT_SUNDAY),))
+    assert data.get("available_slots") == []
+
+
+def test_bulk_create_appointments():
+    """One bulk POST books a whole batch, with per-item results."""
+    batch = [
+        {
+            **BASE_APPOINTMENT,
+            "name": f"Bulk Test User {index}",
+            "complaint": "Testing bulk appointment creation",
+            "appointmentDate": SECOND_WEEKDAY,
+            "timeSlot": time_slot
         }
-        
-        try:
-            # Create appointment
-            create_response = self.session.post(f"{BACKEND_URL}/appointments", 
-                                              json=test_appointment,
-                                              headers={'Content-Type': 'application/json'})
-            
-            if create_response.status_code == 200:
-                created_data = create_response.json()
-                appointment_id = created_data["id"]
-                
-                # Retrieve all appointments and verify our appointment exists
-                get_response = self.session.get(f"{BACKEND_URL}/appointments")
-                
-                if get_response.status_code == 200:
-                    all_appointments = get_response.json()
-                    found_appointment = None
-                    
-                    for appointment in all_appointments:
-                        if appointment.get("id") == appointment_id:
-                            found_appointment = appointment
-                            break
-                    
-                    if found_appointment:
-                        # Verify all data matches
-                        data_matches = (
-                            found_appointment["name"] == unique_name and
-                            found_appointment["sex"] == test_appointment["sex"] and
-                            found_appointment["age"] == test_appointment["age"] and
-                            found_appointment["complaint"] == test_appointment["complaint"] and
-                            found_appointment["time_slot"] == test_appointment["timeSlot"]
-                        )
-                        
-                        if data_matches:
-                            self.log_test("Data Persistence in MongoDB", True, 
-                                        f"Appointment {appointment_id} correctly persisted and retrieved")
-                            return True
-                        else:
-                            self.log_test("Data Persistence in MongoDB", False, 
-                                        f"Data mismatch: created={test_appointment}, retrieved={found_appointment}")
-                            return False
-                    else:
-                        self.log_test("Data Persistence in MongoDB", False, 
-                                    f"Created appointment {appointment_id} not found in database")
-                        return False
-                else:
-                    self.log_test("Data Persistence in MongoDB", False, 
-                                f"Failed to retrieve appointments: {get_response.status_code}")
-                    return False
-            else:
-                self.log_test("Data Persistence in MongoDB", False, 
-                            f"Failed to create test appointment: {create_response.status_code}")
-                return False
-                
-        except Exception as e:
-            self.log_test("Data Persistence in MongoDB", False, f"Request error: {str(e)}")
-            return False
-    
-    def run_all_tests(self):
-        """Run all backend tests"""
-        print("=" * 80)
-        print("🧪 BACKEND API TESTING - Node.js + Express + MongoDB")
-        print("=" * 80)
-        print(f"Backend URL: {BACKEND_URL}")
-        print()
-        
-        # Run tests in order
-        tests = [
-            self.test_mongodb_connection,
-            self.test_post_appointments_endpoint,
-            self.test_post_appointments_validation,
-            self.test_get_appointments_endpoint,
-            self.test_get_available_slots_endpoint,
-            self.test_saturday_sunday_restrictions,
-            self.test_data_persistence
-        ]
-        
-        passed = 0
-        total = 0
-        
-        for test in tests:
-            try:
-                result = test()
-                if result:
-                    passed += 1
-                total += 1
-                print()  # Add spacing between tests
-            except Exception as e:
-                print(f"❌ FAIL: {test.__name__} - Unexpected error: {str(e)}")
-                total += 1
-                print()
-        
-        # Summary
-        print("=" * 80)
-        print("📊 TEST SUMMARY")
-        print("=" * 80)
-        print(f"Total Tests: {total}")
-        print(f"Passed: {passed}")
-        print(f"Failed: {total - passed}")
-        print(f"Success Rate: {(passed/total)*100:.1f}%")
-        
-        if passed == total:
-            print("\n🎉 ALL TESTS PASSED! Backend is working correctly.")
-        else:
-            print(f"\n⚠️  {total - passed} test(s) failed. Please check the issues above.")
-        
-        return passed == total
+        for index, time_slot in enumerate(["2:00–3:00 PM", "3:00–4:00 PM"])
+    ]
+    # A restricted booking in the batch must be rejected per-item without
+    # sinking the valid ones around it
+    batch.append({
+        **BASE_APPOINTMENT,
+        "name": "Bulk Sunday User",
+        "complaint": "Testing bulk per-item rejection",
+        "appointmentDate": NEXT_SUNDAY,
+        "timeSlot": "10:00–11:00 AM"
+    })
+
+    response = SESSION.post(f"{BACKEND_URL}/appointments/bulk", data=_encode_body(batch))
+    assert response.status_code == 200, response.text
+    _get_json.cache_clear()  # two bookings landed; cached reads are stale
+
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["created", "created", "rejected"], results
+    for result, payload in zip(results[:2], batch):
+        assert result["appointment"]["name"] == payload["name"], result
+
+
+def test_data_persistence():
+    """A created appointment comes back intact from the listing endpoint."""
+    unique_name = f"Persistence Test User {uuid.uuid4().hex[:8]}"
+    test_appointment = {
+        **BASE_APPOINTMENT,
+        "name": unique_name,
+        "sex": "Other",
+        "age": 28,
+        "complaint": "Testing data persistence in MongoDB database",
+        "appointmentDate": SECOND_WEEKDAY
+    }
+
+    create_response = _post_appointment(_encode_body(test_appointment))
+    assert create_response.status_code == 200, create_response.text
+    _get_json.cache_clear()  # the cached listing no longer includes this booking
+    appointment_id = create_response.json()["id"]
+    log.info("created appointment %s for persistence check", appointment_id)
+
+    listing = _get_json("/appointments")
+    found = next((a for a in listing if a.get("id") == appointment_id), None)
+    assert found is not None, f"appointment {appointment_id} not found in listing"
+
+    assert found["name"] == unique_name
+    assert found["sex"] == test_appointment["sex"]
+    assert found["age"] == test_appointment["age"]
+    assert found["complaint"] == test_appointment["complaint"]
+    assert found["time_slot"] == test_appointment["timeSlot"]
+
 
 if __name__ == "__main__":
-    tester = BackendTester()
-    success = tester.run_all_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    # Running as a plain script delegates to pytest, preserving the old
+    # "python backend_test.py" entry point
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sys.exit(pytest.main([__file__, "-v"]))